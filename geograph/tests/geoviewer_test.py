@@ -0,0 +1,77 @@
+"""Tests for the components disk cache of the GeoGraphViewer."""
+import geograph
+import geopandas as gpd
+import pytest
+from geograph.constants import SRC_PATH
+from geograph.visualisation.geoviewer import GeoGraphViewer
+from geograph.visualisation.graph_utils import get_graph_hash
+
+TEST_DATA_PATH = SRC_PATH / "tests" / "testdata" / "adjacent" / "full.gpkg"
+
+
+def _load_graph() -> geograph.GeoGraph:
+    df = gpd.read_file(TEST_DATA_PATH)
+    return geograph.GeoGraph(df, crs=df.crs, tolerance=0.0)
+
+
+@pytest.fixture
+def component_calls(monkeypatch) -> list:
+    """Record calls of GeoGraph.get_graph_components that calculate polygons."""
+    calls = []
+    get_graph_components = geograph.GeoGraph.get_graph_components
+
+    def _recording(self, calc_polygons=True, **kwargs):
+        if calc_polygons:
+            calls.append(self)
+        return get_graph_components(self, calc_polygons=calc_polygons, **kwargs)
+
+    monkeypatch.setattr(geograph.GeoGraph, "get_graph_components", _recording)
+    return calls
+
+
+def test_component_cache_written_atomically(tmp_path, component_calls) -> None:
+    """First call writes a single cache file and leaves no temporary file."""
+    graph = _load_graph()
+    GeoGraphViewer(cache_dir=tmp_path)._get_component_df(graph)
+
+    assert len(component_calls) == 1
+    assert [path.name for path in tmp_path.iterdir()] == [
+        "components_{}.pickle".format(get_graph_hash(graph))
+    ]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_component_cache_loaded_from_disk(tmp_path, component_calls) -> None:
+    """Second viewer loads the components without recalculating them."""
+    component_df = GeoGraphViewer(cache_dir=tmp_path)._get_component_df(_load_graph())
+    cached_df = GeoGraphViewer(cache_dir=tmp_path)._get_component_df(_load_graph())
+
+    assert len(component_calls) == 1
+    assert cached_df.geometry.geom_equals(component_df.geometry).all()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"garbage",
+        b"\x80\x04\x95truncated",
+        # Refers to a class that no longer exists, as after a library upgrade
+        b"\x80\x04cno_such_module\nGeoDataFrame\n.",
+    ],
+)
+def test_component_cache_recovers_from_corrupt_file(
+    tmp_path, component_calls, content
+) -> None:
+    """Corrupt cache file is recalculated and overwritten."""
+    graph = _load_graph()
+    cache_path = tmp_path / "components_{}.pickle".format(get_graph_hash(graph))
+    cache_path.write_bytes(content)
+
+    GeoGraphViewer(cache_dir=tmp_path)._get_component_df(graph)
+    assert len(component_calls) == 1
+    assert cache_path.read_bytes() != content
+
+    GeoGraphViewer(cache_dir=tmp_path)._get_component_df(_load_graph())
+    assert len(component_calls) == 1
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,37 @@
+"""Tests for the graph utils of the visualisation module."""
+import geograph
+import geopandas as gpd
+import shapely.affinity
+from geograph.constants import SRC_PATH
+from geograph.visualisation.graph_utils import get_graph_hash
+
+TEST_DATA_PATH = SRC_PATH / "tests" / "testdata" / "adjacent" / "full.gpkg"
+
+
+def _load_graph() -> geograph.GeoGraph:
+    df = gpd.read_file(TEST_DATA_PATH)
+    return geograph.GeoGraph(df, crs=df.crs, tolerance=0.0)
+
+
+def test_graph_hash_equal_graphs() -> None:
+    """Hash is the same for two separately loaded but equal graphs."""
+    assert get_graph_hash(_load_graph()) == get_graph_hash(_load_graph())
+
+
+def test_graph_hash_edge_change() -> None:
+    """Hash changes if an edge is removed from the graph."""
+    graph = _load_graph()
+    original_hash = get_graph_hash(graph)
+    graph.graph.remove_edge(*next(iter(graph.graph.edges())))
+    assert get_graph_hash(graph) != original_hash
+
+
+def test_graph_hash_geometry_change() -> None:
+    """Hash changes if a polygon of the graph is changed."""
+    graph = _load_graph()
+    original_hash = get_graph_hash(graph)
+    node_id = graph.df.index[0]
+    graph.df.loc[node_id, "geometry"] = shapely.affinity.translate(
+        graph.df.geometry.loc[node_id], xoff=1.0
+    )
+    assert get_graph_hash(graph) != original_hash
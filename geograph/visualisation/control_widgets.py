@@ -134,8 +134,8 @@ class RadioVisibilityWidget(BaseControlWidget):
         layers = list(self.viewer.layer_dict[layer_type].items())
         for layer_name, layer in layers:
             layer_str = layer_name
-            if layer_type == "graphs" and layer["is_habitat"]:
-                layer_str += " (habitat of {})".format(layer["parent"])
+            if layer_type == "graphs" and layer.is_habitat:
+                layer_str += " (habitat of {})".format(layer.parent)
             layer_list.append((layer_str, layer_name))
 
         radio_buttons = widgets.RadioButtons(
@@ -379,12 +379,12 @@ class LayerButtonWidget(widgets.ToggleButton):
 
     def _check_layer_exists(self) -> None:
         """Check if layer exists and hide button if it doesn't."""
-        layer_exists = (
-            self.viewer.layer_dict[self.layer_type][self.layer_name][
-                self.layer_subtype
-            ]["layer"]
-            is not None
+        layer = getattr(
+            self.viewer.layer_dict[self.layer_type][self.layer_name],
+            self.layer_subtype,
         )
+        # Layers with a builder are created once they are first made visible
+        layer_exists = layer.layer is not None or layer.builder is not None
         # hide button if layer doesn't exist
         if layer_exists:
             self.layout.display = "block"
@@ -433,7 +433,7 @@ class CheckboxVisibilityWidget(BaseControlWidget):
             for layer_subtype in ["graph", "pgons"]
         ]
         maps = [
-            (name, "maps", "map", map_layer["map"])
+            (name, "maps", "map", map_layer)
             for name, map_layer in self.viewer.layer_dict["maps"].items()
         ]
 
@@ -446,7 +446,7 @@ class CheckboxVisibilityWidget(BaseControlWidget):
 
             # Indent habitat checkboxes
             if layer_type == "graphs":
-                if layer_dict["is_habitat"]:
+                if layer_dict.is_habitat:
                     layout = widgets.Layout(padding="0px 0px 0px 25px")
 
             checkbox = widgets.Checkbox(
@@ -481,7 +481,7 @@ class CheckboxVisibilityWidget(BaseControlWidget):
             if (
                 layer_type == "graphs"
                 and layer_subtype == "pgons"
-                and not layer_dict["is_habitat"]
+                and not layer_dict.is_habitat
             ):
                 checkboxes.append(
                     widgets.HTML(
@@ -645,17 +645,18 @@ class MetricsWidget(BaseControlWidget):
 
                 graph_name = change["new"]
                 graph_layer = change["owner"].layer_dict["graphs"][graph_name]
-                graph = graph_layer["original_graph"]
-                metrics = graph_layer["metrics"]
+                graph = graph_layer.original_graph
+                # Metrics are calculated on first access and then cached by graph
+                metrics = [graph.get_metric(name) for name in graph_layer.metrics]
 
                 # Adding general and habitat graph information
                 metrics_str = widget_utils.create_html_header(
                     "Information", level=2
                 ).value
 
-                if graph_layer["is_habitat"]:
+                if graph_layer.is_habitat:
                     information = {
-                        "parent": graph_layer["parent"],
+                        "parent": graph_layer.parent,
                         "valid_classes": graph.valid_classes,
                         "max_travel_distance": graph.max_travel_distance,
                         # "barrier_classes": graph_layer["barrier_classes"] #TODO: add
@@ -785,16 +786,16 @@ class HoverWidget(BaseControlWidget):
 
         # Add callback to all patch (pgon) layer of graphs
         for graph_dict in self.viewer.layer_dict["graphs"].values():
-            pgon_choropleth = graph_dict["pgons"]["layer"]
+            pgon_choropleth = graph_dict.pgons.layer
             pgon_choropleth.on_hover(self._hover_callback)
 
             # Enable hover for node dynamics
-            node_dynamics_choropleth = graph_dict["node_dynamics"]["layer"]
+            node_dynamics_choropleth = graph_dict.node_dynamics.layer
             if node_dynamics_choropleth is not None:
                 node_dynamics_choropleth.on_hover(self._hover_callback)
 
             # Enable hover for node absolute growth (change)
-            abs_growth_choropleth = graph_dict["node_change"]["layer"]
+            abs_growth_choropleth = graph_dict.node_change.layer
             if abs_growth_choropleth is not None:
                 abs_growth_choropleth.on_hover(self._hover_callback)
 
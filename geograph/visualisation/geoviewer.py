@@ -1,11 +1,20 @@
 """This module contains the GeoGraphViewer to visualise GeoGraphs"""
 from __future__ import annotations
+import copy
+import functools
+import itertools
 import logging
+import operator
+import os
+import pathlib
+import pickle
+import tempfile
 import threading
-import time
-from typing import TYPE_CHECKING, List, Optional, Union
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Union
 import folium
 import geograph
+import geopandas as gpd
 import ipyleaflet
 import ipywidgets as widgets
 import pandas as pd
@@ -20,8 +29,78 @@ from geograph.visualisation import (
     widget_utils,
 )
 
-if TYPE_CHECKING:
-    import geopandas as gpd
+
+class _LayerEntry:
+    """Base of the layer_dict entries, allowing item access like a dict.
+
+    Fields are stored in `__slots__`, such that the entries need less memory
+    and attribute lookup is fast. Item access (e.g. `entry["layer"]`) is kept
+    for compatibility with code using layer_dict entries as dicts.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+
+@dataclass()
+class SubLayer(_LayerEntry):
+    """Layer in GeoGraphViewer together with its visibility."""
+
+    __slots__ = ("layer", "active", "builder")
+
+    layer: Optional[ipyleaflet.Layer]
+    active: bool
+    # If set, creates the layer once it is first made visible
+    builder: Optional[Callable[[], ipyleaflet.Layer]]
+
+
+@dataclass()
+class MapLayer(_LayerEntry):
+    """Map (tile) layer entry in GeoGraphViewer.layer_dict."""
+
+    __slots__ = ("map",)
+
+    map: SubLayer
+
+
+@dataclass()
+class GraphLayer(_LayerEntry):
+    """Graph entry in GeoGraphViewer.layer_dict, with one SubLayer per subtype."""
+
+    __slots__ = (
+        "pgons",
+        "graph",
+        "components",
+        "disconnected_nodes",
+        "poorly_connected_nodes",
+        "node_dynamics",
+        "node_change",
+        "metrics",
+        "original_graph",
+        "is_habitat",
+        "parent",
+    )
+
+    pgons: SubLayer
+    graph: SubLayer
+    components: SubLayer
+    disconnected_nodes: SubLayer
+    poorly_connected_nodes: SubLayer
+    node_dynamics: SubLayer
+    node_change: SubLayer
+    metrics: List[str]
+    original_graph: geograph.GeoGraph
+    is_habitat: bool
+    parent: Optional[str]
 
 
 class GeoGraphViewer(ipyleaflet.Map):
@@ -37,6 +116,8 @@ class GeoGraphViewer(ipyleaflet.Map):
         logging_level: str = "WARNING",
         max_log_len: int = 20,
         layer_update_delay: float = 0.0,
+        prefer_canvas: bool = True,
+        cache_dir: Optional[Union[str, pathlib.Path]] = None,
         **kwargs,
     ) -> None:
         """Class for interactively viewing a GeoGraph.
@@ -60,6 +141,15 @@ class GeoGraphViewer(ipyleaflet.Map):
                 before updating layer. Whilst waiting other layer update requests
                 are caught. This reduces the amount of traffic between the client (your
                 browser) and the python kernel. Experimental. Defaults to 0.0.
+            prefer_canvas (bool, optional): whether vector layers (polygons, lines and
+                node markers) are rendered on a canvas instead of as SVG elements.
+                Canvas rendering is considerably faster for graphs with thousands of
+                nodes. Defaults to True.
+            cache_dir (Union[str, pathlib.Path], optional): directory in which to
+                store graph component polygons, such that these are only calculated
+                once for the same graph, even across sessions. Warning: the cache
+                uses pickle, so only use a directory with trusted content. If None,
+                nothing is stored on disk. Defaults to None.
 
         """
         super().__init__(
@@ -68,12 +158,17 @@ class GeoGraphViewer(ipyleaflet.Map):
             scroll_wheel_zoom=True,
             crs=ipyleaflet.projections.EPSG3857,  # EPSG code for WGS84 CRS
             zoom_snap=0.1,
+            prefer_canvas=prefer_canvas,
             **kwargs,
         )
         # There seems to be no easy way to add UTM35N to ipyleaflet.Map(), hence WGS84.
         self.gpd_crs_code = WGS84
         self.small_screen = small_screen
         self.layer_update_delay = layer_update_delay
+        if cache_dir is not None:
+            cache_dir = pathlib.Path(cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = cache_dir
 
         if metric_list is None:
             self.metrics = metrics.STANDARD_METRICS
@@ -96,16 +191,20 @@ class GeoGraphViewer(ipyleaflet.Map):
         )
 
         # Note: entries in layer_dict follow the convention:
-        # ipywidgets_layer = layer_dict[type][name][subtype]["layer"]
-        # Layers of type "maps" only have subtype "map".
+        # ipywidgets_layer = getattr(layer_dict[type][name], subtype).layer
+        # Layers of type "maps" (MapLayer) only have subtype "map", layers of type
+        # "graphs" (GraphLayer) have the subtypes in self.graph_subtypes.
         # The layer_dict overrules the ipyleaflet.Map() attribute .layers
         self.layer_dict = dict(
             maps=dict(
-                OpenStreetMap=dict(map=dict(layer=default_map_layer, active=True))
+                OpenStreetMap=MapLayer(
+                    map=SubLayer(layer=default_map_layer, active=True, builder=None)
+                )
             ),
             graphs=dict(),
         )
-        self.layer_style = style.DEFAULT_LAYER_STYLE
+        # Copied, such that changes in style do not affect the defaults of other viewers
+        self.layer_style = copy.deepcopy(style.DEFAULT_LAYER_STYLE)
 
         self.graph_subtypes = [
             "pgons",
@@ -125,7 +224,7 @@ class GeoGraphViewer(ipyleaflet.Map):
         )
         self.current_graph = ""
         self.current_map = "Map"  # set to the default map added above
-        self.layer_update_requested = False
+        self._layer_update_timer: Optional[threading.Timer] = None
 
         self.logger.info("Viewer successfully initialised.")
 
@@ -135,7 +234,8 @@ class GeoGraphViewer(ipyleaflet.Map):
         """Set visiblity for a specific layer
 
         Set the visibility for layer in
-        `layer_dict[layer_type][layer_name][layer_subtype]`.
+        `layer_dict[layer_type][layer_name]`. Layers that are created lazily (these
+        have a builder) are created when first made visible.
 
         Args:
             layer_type (str): type of layer (e.g. "maps","graphs")
@@ -146,19 +246,23 @@ class GeoGraphViewer(ipyleaflet.Map):
         self.logger.debug(
             "Set visibility of %s: %s to %s", layer_name, layer_subtype, active
         )
-        self.layer_dict[layer_type][layer_name][layer_subtype]["active"] = active
+        layer = getattr(self.layer_dict[layer_type][layer_name], layer_subtype)
+        if active and layer.layer is None and layer.builder is not None:
+            self.logger.debug("Creating %s: %s", layer_name, layer_subtype)
+            layer.layer = layer.builder()
+            layer.builder = None
+        layer.active = active
 
     def hide_all_layers(self) -> None:
         """Hide all layers in self.layer_dict."""
-        for layer_type, type_dict in self.layer_dict.items():
-            for layer_name in type_dict:
-                if layer_type == "maps":
-                    self.set_layer_visibility(layer_type, layer_name, "map", False)
-                elif layer_type == "graphs":
-                    for layer_subtype in self.graph_subtypes:
-                        self.set_layer_visibility(
-                            layer_type, layer_name, layer_subtype, False
-                        )
+        # Visibility is set directly instead of via set_layer_visibility, to avoid a
+        # log call for each layer.
+        for map_layer in self.layer_dict["maps"].values():
+            map_layer.map.active = False
+        for graph in self.layer_dict["graphs"].values():
+            for layer_subtype in self.graph_subtypes:
+                getattr(graph, layer_subtype).active = False
+        self.logger.debug("Set visibility of all layers to False")
         self.layer_update()
 
     def add_layer(self, layer: Union[dict, ipyleaflet.Layer], name=None) -> None:
@@ -175,12 +279,14 @@ class GeoGraphViewer(ipyleaflet.Map):
         else:
             if name is None:
                 name = layer.name
-        if layer.model_id in self._layer_ids or name in self.layer_dict["maps"].keys():
+        if name in self.layer_dict["maps"] or layer.model_id in self._layer_ids:
             raise ipyleaflet.LayerException(
                 "layer with same name already on map, change name argument: %r" % layer
             )
 
-        self.layer_dict["maps"][name] = dict(map=dict(layer=layer, active=True))
+        self.layer_dict["maps"][name] = MapLayer(
+            map=SubLayer(layer=layer, active=True, builder=None)
+        )
         self.layer_update()
 
     def add_graph(
@@ -194,12 +300,13 @@ class GeoGraphViewer(ipyleaflet.Map):
         Args:
             graph (geograph.GeoGraph): graph to be added
             name (str, optional): name shown in control panel. Defaults to "Graph".
-            with_components(bool, optional): Iff True the graph components are
-                calculated. Warning, this can make the loading of the viewer slow.
+            with_components(bool, optional): Iff True the graph components can be
+                shown. They are only calculated once their layer is first made
+                visible. Warning, this can be slow for large graphs.
                 Defaults to True.
         """
         self.logger.info("Started adding GeoGraph.")
-        if name in graph.habitats.keys():
+        if name in graph.habitats:
             raise ValueError(
                 "Name given cannot be same as habitat name in given GeoGraph."
             )
@@ -209,10 +316,14 @@ class GeoGraphViewer(ipyleaflet.Map):
             )
 
         graphs = {name: graph, **graph.habitats}
+        # Loop invariants, bound once before the loop
+        num_graphs = len(graphs)
+        layer_style = self.layer_style
+        graph_layers = self.layer_dict["graphs"]
 
         for idx, (current_name, current_graph) in enumerate(graphs.items()):
             self.logger.info(
-                "Started adding graph %s of %s: %s", idx + 1, len(graphs), current_name
+                "Started adding graph %s of %s: %s", idx + 1, num_graphs, current_name
             )
 
             # Calculate patch metrics for current graph
@@ -224,18 +335,25 @@ class GeoGraphViewer(ipyleaflet.Map):
             nodes, edges = graph_utils.create_node_edge_geometries(
                 current_graph, crs=self.gpd_crs_code
             )
+            edges_and_nodes = pd.concat([edges, nodes])
             graph_geo_data = ipyleaflet.GeoData(
-                geo_dataframe=pd.concat([edges, nodes])
-                .to_frame(name="geometry")
-                .reset_index(),
+                geo_dataframe=gpd.GeoDataFrame(
+                    {"geometry": edges_and_nodes.values}, index=edges_and_nodes.index
+                ).reset_index(),
                 name=current_name + "_graph",
-                **self.layer_style["graph"],
+                **layer_style["graph"],
             )
 
+            # Reprojecting once, shared by all choropleth layers of current graph
+            wgs84_df = current_graph.df.to_crs(WGS84)
+
             # Creating choropleth layer for patch polygons
             self.logger.debug("Creating patch polygons layer (pgon_choropleth).")
             pgon_choropleth = self._get_choropleth_from_df(
-                current_graph.df, colname="class_label", **self.layer_style["pgons"]
+                current_graph.df,
+                colname="class_label",
+                wgs84_df=wgs84_df,
+                **layer_style["pgons"],
             )
 
             # Creating choropleth layer for node identification
@@ -244,93 +362,96 @@ class GeoGraphViewer(ipyleaflet.Map):
                 dynamics_choropleth = self._get_choropleth_from_df(
                     graph_utils.map_dynamic_to_int(current_graph.df),
                     colname="dynamic_class",
+                    wgs84_df=wgs84_df,
                     **style._NODE_DYNAMICS_STYLE,  # pylint: disable=protected-access
                 )
                 abs_growth_choropleth = self._get_choropleth_from_df(
                     current_graph.df,
                     colname="absolute_growth",
+                    wgs84_df=wgs84_df,
                     **style._ABS_GROWTH_STYLE,  # pylint: disable=protected-access
                 )
             else:
                 dynamics_choropleth = None
                 abs_growth_choropleth = None
 
-            # Creating layer for graph components
+            # Deferring layer for graph components until it is first made visible
+            components = SubLayer(layer=None, active=False, builder=None)
             if with_components:
-                self.logger.debug("Creating components layer (component_choropleth).")
-                component_df = current_graph.get_graph_components(
-                    calc_polygons=True
-                ).df.copy()
-                if is_habitat:
-                    component_df.geometry = component_df.geometry.buffer(
-                        current_graph.max_travel_distance
+                components.builder = functools.partial(
+                    self._create_component_layer,
+                    current_graph,
+                    current_name,
+                    is_habitat,
+                )
+
+            # Binning nodes by degree in a single pass over the graph's degree view
+            disconnected, poorly_connected = [], []
+            for node, degree in current_graph.graph.degree():
+                if degree == 0:
+                    disconnected.append(node)
+                elif degree == 1:
+                    poorly_connected.append(node)
+
+            # Positions of nodes in dataframe. get_indexer returns -1 for missing
+            # nodes, which would silently select the last row with iloc.
+            disconnected_pos = nodes.index.get_indexer(disconnected)
+            poorly_connected_pos = nodes.index.get_indexer(poorly_connected)
+            if (disconnected_pos < 0).any() or (poorly_connected_pos < 0).any():
+                raise KeyError(
+                    "Nodes of graph {} are missing from its dataframe.".format(
+                        current_name
                     )
-                component_choropleth = ipyleaflet.GeoData(
-                    geo_dataframe=component_df.to_crs(WGS84),
-                    name=current_name + "_components",
-                    **self.layer_style["components"],
                 )
-            else:
-                component_choropleth = None
 
             # Creating layer for disconnected (no-edge) nodes
             self.logger.debug(
                 "Creating disconnected node layer (discon_nodes_geo_data)."
             )
-            disconnected = [
-                node
-                for node in current_graph.graph.nodes()
-                if current_graph.graph.degree[node] == 0
-            ]
             discon_nodes_geo_data = ipyleaflet.GeoData(
-                geo_dataframe=nodes.loc[disconnected].to_frame(name="geometry"),
+                geo_dataframe=nodes.iloc[disconnected_pos].to_frame(name="geometry"),
                 name=current_name + "_disconnected_nodes",
-                **self.layer_style["disconnected_nodes"],
+                **layer_style["disconnected_nodes"],
             )
 
             # Creating layer for poorly connected (one-edge) nodes
             self.logger.debug(
                 "Creating poorly connected node layer (poorly_con_nodes_geo_data)."
             )
-            poorly_connected = [
-                node
-                for node in current_graph.graph.nodes()
-                if current_graph.graph.degree[node] == 1
-            ]
             poorly_con_nodes_geo_data = ipyleaflet.GeoData(
-                geo_dataframe=nodes.loc[poorly_connected].to_frame(name="geometry"),
+                geo_dataframe=nodes.iloc[poorly_connected_pos].to_frame(
+                    name="geometry"
+                ),
                 name=current_name + "_poorly_connected_nodes",
-                **self.layer_style["poorly_connected_nodes"],
+                **layer_style["poorly_connected_nodes"],
             )
 
-            # Getting graph metrics
-            self.logger.debug("Add graph metrics.")
-            graph_metrics = []
-            for metric in self.metrics:
-                graph_metrics.append(
-                    current_graph.get_metric(metric)
-                )  # pylint: disable=protected-access
-
             # Combining all layers and adding them to layer_dict
             self.logger.debug("Assembling layer dict (layer).")
-            layer = dict(
-                is_habitat=is_habitat,
-                graph=dict(layer=graph_geo_data, active=True),
-                pgons=dict(layer=pgon_choropleth, active=True),
-                components=dict(layer=component_choropleth, active=False),
-                disconnected_nodes=dict(layer=discon_nodes_geo_data, active=False),
-                poorly_connected_nodes=dict(
-                    layer=poorly_con_nodes_geo_data, active=False
+            layer = GraphLayer(
+                pgons=SubLayer(layer=pgon_choropleth, active=True, builder=None),
+                graph=SubLayer(layer=graph_geo_data, active=True, builder=None),
+                components=components,
+                disconnected_nodes=SubLayer(
+                    layer=discon_nodes_geo_data, active=False, builder=None
+                ),
+                poorly_connected_nodes=SubLayer(
+                    layer=poorly_con_nodes_geo_data, active=False, builder=None
+                ),
+                node_dynamics=SubLayer(
+                    layer=dynamics_choropleth, active=False, builder=None
                 ),
-                node_dynamics=dict(layer=dynamics_choropleth, active=False),
-                node_change=dict(layer=abs_growth_choropleth, active=False),
-                metrics=graph_metrics,
+                node_change=SubLayer(
+                    layer=abs_growth_choropleth, active=False, builder=None
+                ),
+                # Metrics are only calculated once shown in the metrics widget
+                metrics=list(self.metrics),
                 original_graph=current_graph,
+                is_habitat=is_habitat,
+                parent=name if is_habitat else None,
             )
-            if is_habitat:
-                layer["parent"] = name
 
-            self.layer_dict["graphs"][current_name] = layer
+            graph_layers[current_name] = layer
             self.logger.info("Finished adding graph: %s.", current_name)
 
         self.current_graph = name
@@ -338,26 +459,40 @@ class GeoGraphViewer(ipyleaflet.Map):
         self.logger.info("Added graph.")
 
     def _get_choropleth_from_df(
-        self, df: gpd.GeoDataFrame, colname: str = "class_label", **choropleth_args
+        self,
+        df: gpd.GeoDataFrame,
+        colname: str = "class_label",
+        wgs84_df: Optional[gpd.GeoDataFrame] = None,
+        **choropleth_args,
     ) -> ipyleaflet.Choropleth:
         """Create ipyleaflet.Choropleth from GeoDataFrame of polygons.
 
         Args:
             df (gpd.GeoDataFrame): dataframe to visualise
             colname (str): name of the column to display as choropleth data
+            wgs84_df (gpd.GeoDataFrame, optional): df already reprojected to WGS84,
+                used for the polygons of the layer. If None, df is reprojected.
+                Defaults to None.
             **choropleth_args: Keywordarguments passed to `ipyleaflet.Choropleth`.
 
         Returns:
             ipyleaflet.Choropleth: choropleth layer
         """
-        geo_data = df.to_crs(WGS84).__geo_interface__  # ipyleaflet works with WGS84
+        if wgs84_df is None:
+            wgs84_df = df.to_crs(WGS84)  # ipyleaflet works with WGS84
+        # Unlike __geo_interface__, iterfeatures can skip computing the bounding
+        # box of each feature, which ipyleaflet does not use.
+        geo_data = {
+            "type": "FeatureCollection",
+            "features": list(wgs84_df.iterfeatures(na="null", show_bbox=False)),
+        }
         if pd.api.types.is_numeric_dtype(df[colname]):
             # for numeric types, display the numeric data directly
-            choro_data = {str(key): val for key, val in df[colname].items()}
+            values = df[colname].to_numpy()
         else:
             # for categorical types, convert to numbers and display those
-            col_as_categories = df[colname].astype("category").cat.codes
-            choro_data = {str(key): val for key, val in col_as_categories.items()}
+            values, _ = pd.factorize(df[colname], sort=True)
+        choro_data = dict(zip(df.index.astype(str).to_numpy(), values.tolist()))
 
         # create ipyleaflet layer
         choropleth_layer = ipyleaflet.Choropleth(
@@ -366,49 +501,128 @@ class GeoGraphViewer(ipyleaflet.Map):
 
         return choropleth_layer
 
+    def _create_component_layer(
+        self, graph: geograph.GeoGraph, name: str, is_habitat: bool
+    ) -> ipyleaflet.GeoData:
+        """Create layer showing the components of a graph.
+
+        Args:
+            graph (geograph.GeoGraph): graph to show components of
+            name (str): name of the graph in viewer
+            is_habitat (bool): whether graph is a habitat, in which case the
+                components are buffered by the habitat's max_travel_distance
+
+        Returns:
+            ipyleaflet.GeoData: components layer
+        """
+        self.logger.debug("Creating components layer (component_choropleth).")
+        component_df = self._get_component_df(graph)
+        if is_habitat:
+            component_df = component_df.copy()
+            component_df.geometry = component_df.geometry.buffer(
+                graph.max_travel_distance
+            )
+        return ipyleaflet.GeoData(
+            geo_dataframe=component_df.to_crs(WGS84),
+            name=name + "_components",
+            **self.layer_style["components"],
+        )
+
+    def _get_component_df(self, graph: geograph.GeoGraph) -> gpd.GeoDataFrame:
+        """Get dataframe with the polygons of the graph components.
+
+        Components already calculated for the graph are reused. If `self.cache_dir`
+        is set, the polygons are additionally stored on disk, keyed by a hash of the
+        graph, and loaded from there if the same graph is added again.
+
+        Args:
+            graph (geograph.GeoGraph): graph to get components of
+
+        Returns:
+            gpd.GeoDataFrame: dataframe with a polygon for each component
+        """
+        components = getattr(graph, "components", None)
+        if components is not None and components.has_df:
+            return components.df
+
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path = self.cache_dir / "components_{}.pickle".format(
+                graph_utils.get_graph_hash(graph)
+            )
+            if cache_path.exists():
+                self.logger.debug("Loading components from %s.", cache_path)
+                try:
+                    with open(cache_path, "rb") as file:
+                        return pickle.load(file)
+                except Exception:  # pylint: disable=broad-except
+                    # Besides corrupt files, unpickling fails for files written
+                    # with other versions of geopandas, shapely or pandas
+                    self.logger.warning(
+                        "Unable to load components cache file %s, recalculating.",
+                        cache_path,
+                        exc_info=True,
+                    )
+
+        component_df = graph.get_graph_components(calc_polygons=True).df
+        if cache_path is not None:
+            # Write to a temporary file first and then move it into place, such that
+            # an interrupted write does not leave a truncated cache file behind
+            tmp_file = tempfile.NamedTemporaryFile(
+                dir=self.cache_dir, suffix=".tmp", delete=False
+            )
+            try:
+                with tmp_file:
+                    pickle.dump(component_df, tmp_file)
+                os.replace(tmp_file.name, cache_path)
+            except BaseException:
+                os.remove(tmp_file.name)
+                raise
+        return component_df
+
     def layer_update(self) -> None:
         """Update `self.layer` tuple from `self.layer_dict`."""
-        layers = [
-            map_layer["map"]["layer"]
-            for map_layer in self.layer_dict["maps"].values()
-            if map_layer["map"]["active"]
-        ]
-        for graph in self.layer_dict["graphs"].values():
-            for graph_subtype in self.graph_subtypes:
-                if graph[graph_subtype]["active"]:
-                    layers.append(graph[graph_subtype]["layer"])
-
-        self.layers = tuple(layers)
+        # Bound once to locals, as this is called on every change in visibility
+        maps = self.layer_dict["maps"].values()
+        graphs = self.layer_dict["graphs"].values()
+        get_graph_sublayers = operator.attrgetter(*self.graph_subtypes)
+
+        self.layers = tuple(
+            itertools.chain(
+                (map_layer.map.layer for map_layer in maps if map_layer.map.active),
+                (
+                    sublayer.layer
+                    for graph in graphs
+                    for sublayer in get_graph_sublayers(graph)
+                    if sublayer.active
+                ),
+            )
+        )
         self.logger.debug("layer_update() called.")
 
     def request_layer_update(self):
         """Request layer_update to be called.
 
-        After receiving the first request the viewer waits for a set time, and then
-        executes its layer_update method. If new requests come in whilst this time
-        is passing no further action is taken. This helps avoid calling layer_update
-        for each button in control widgets separately, slowing down the viewer.
+        After receiving a request the viewer waits for a set time, and then
+        executes its layer_update method. If a new request comes in whilst this time
+        is passing, the waiting starts again, such that layer_update is executed
+        once after the last request. This helps avoid calling layer_update for each
+        button in control widgets separately, slowing down the viewer.
         """
 
         if self.layer_update_delay > 0:
             self.logger.debug("Layer update requested.")
 
-            if not self.layer_update_requested:
-                self.layer_update_requested = True
+            if self._layer_update_timer is not None:
+                self._layer_update_timer.cancel()
 
-                def wait_and_update(viewer):
-                    time.sleep(self.layer_update_delay)
-                    viewer.layer_update()
-                    viewer.layer_update_requested = False
-                    viewer.logger.debug("Layer update request executed.")
+            def update():
+                self.layer_update()
+                self.logger.debug("Layer update request executed.")
 
-                thread = threading.Thread(
-                    target=wait_and_update,
-                    args=(self,),
-                )
-                thread.start()
-            else:
-                pass
+            self._layer_update_timer = threading.Timer(self.layer_update_delay, update)
+            self._layer_update_timer.daemon = True
+            self._layer_update_timer.start()
         else:
             self.layer_update()
 
@@ -419,21 +633,24 @@ class GeoGraphViewer(ipyleaflet.Map):
             radius (float): radius of nodes in graph. Defaults to 10.
             node_color (str): (CSS) color of graph node (e.g. "blue")
         """
-        for name, graph in self.layer_dict["graphs"].items():
-            layer = graph["graph"]["layer"]
-
-            # Below doesn't work because traitlet change not observed
-            # layer.point_style['radius'] = radius
-
-            self.layer_style["graph"]["point_style"]["radius"] = radius
-            self.layer_style["graph"]["style"]["fillColor"] = node_color
-            layer = ipyleaflet.GeoData(
-                geo_dataframe=layer.geo_dataframe,
-                name=layer.name,
-                **self.layer_style["graph"],
-            )
-            self.layer_dict["graphs"][name]["graph"]["layer"] = layer
-        self.layer_update()
+        # The style dicts are replaced rather than mutated, as layers added before
+        # may share them (and in-place changes of traits are not observed)
+        graph_style = self.layer_style["graph"]
+        self.layer_style["graph"] = {
+            **graph_style,
+            "point_style": {**graph_style["point_style"], "radius": radius},
+            "style": {**graph_style["style"], "fillColor": node_color},
+        }
+
+        for graph in self.layer_dict["graphs"].values():
+            layer = graph.graph.layer
+
+            # The frontend only reads point_style when (re)creating the layer, hence
+            # the radius is also set via style, which is applied to the existing node
+            # markers directly.
+            with layer.hold_trait_notifications():
+                layer.point_style = {**layer.point_style, "radius": radius}
+                layer.style = {**layer.style, "fillColor": node_color, "radius": radius}
 
     def enable_graph_controls(self) -> None:
         """Add controls for graphs to GeoGraphViewer."""
@@ -1,8 +1,11 @@
 """This module contains utility function for generally plotting graphs."""
 from __future__ import annotations
+import hashlib
+import pickle
 from typing import Tuple
 import geograph
 import geopandas as gpd
+import shapely
 import shapely.geometry
 from geograph.constants import WGS84
 
@@ -38,6 +41,27 @@ def create_node_edge_geometries(
     return node_geoms, edge_geoms
 
 
+def get_graph_hash(graph: geograph.GeoGraph) -> str:
+    """Return hash of the polygons, crs and edges of graph.
+
+    Unlike the builtin `hash`, the result is stable across python sessions, and can
+    therefore be used to identify data derived from the graph that is saved to disk.
+
+    Args:
+        graph (GeoGraph): graph to hash
+
+    Returns:
+        str: hexadecimal hash of graph
+    """
+    graph_hash = hashlib.blake2b(digest_size=16)
+    graph_hash.update(str(graph.df.crs).encode())
+    graph_hash.update(b"".join(shapely.to_wkb(graph.df.geometry.values)))
+    graph_hash.update(
+        pickle.dumps((graph.df.index.tolist(), list(graph.graph.edges())), protocol=4)
+    )
+    return graph_hash.hexdigest()
+
+
 _NODE_DYNAMIC_TO_INT = {
     "split": 0,
     "shrank": 1,
@@ -1,4 +1,5 @@
 """Module with utils for logging, debugging and styling ipywidgets."""
+import collections
 import logging
 import IPython.display
 import ipywidgets as widgets
@@ -29,6 +30,8 @@ class OutputWidgetHandler(logging.Handler):
     def __init__(self, *args, max_len=30, **kwargs):
         super().__init__(*args, **kwargs)
         self.max_len = max_len
+        # Oldest outputs are dropped automatically once max_len is reached
+        self._outputs = collections.deque(maxlen=max_len)
         layout = {
             "width": "100%",
             "border": "1px solid black",
@@ -47,10 +50,8 @@ class OutputWidgetHandler(logging.Handler):
             "output_type": "stream",
             "text": formatted_record + "\n",
         }
-        if len(self.out.outputs) > self.max_len:
-            self.out.outputs = self.out.outputs[1:] + (new_output,)
-        else:
-            self.out.outputs = self.out.outputs + (new_output,)
+        self._outputs.append(new_output)
+        self.out.outputs = tuple(self._outputs)
 
     def show_logs(self):
         """Show the logs"""
@@ -58,4 +59,5 @@ class OutputWidgetHandler(logging.Handler):
 
     def clear_logs(self):
         """Clear the current logs"""
+        self._outputs.clear()
         self.out.clear_output()